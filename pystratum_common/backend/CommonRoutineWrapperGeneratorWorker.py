@@ -144,7 +144,7 @@ class CommonRoutineWrapperGeneratorWorker(RoutineWrapperGeneratorWorker):
         """
         self._code_store.add_import(self._parent_class_namespace, self._parent_class_name)
 
-        self._code_store.append_line('class {0!s}({1!s}):'.format(self._wrapper_class_name, self._parent_class_name))
+        self._code_store.append_line(f'class {self._wrapper_class_name}({self._parent_class_name}):')
         self._code_store.append_line('"""')
         self._code_store.append_line('The stored routines wrappers.')
         self._code_store.append_line('"""')
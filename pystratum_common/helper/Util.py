@@ -26,11 +26,13 @@ class Util:
         :param io: The output decorator.
         """
         write_flag = True
-        if os.path.exists(filename):
+        try:
             with open(filename, 'r') as file:
                 old_data = file.read()
                 if data == old_data:
                     write_flag = False
+        except FileNotFoundError:
+            pass
 
         if write_flag:
             tmp_filename = filename + '.tmp'
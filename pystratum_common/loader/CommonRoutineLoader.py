@@ -1,5 +1,4 @@
 import abc
-import math
 import os
 from typing import Any, Dict
 
@@ -162,24 +161,22 @@ class CommonRoutineLoader(metaclass=abc.ABCMeta):
         :param context: The loader context.
         """
         # Make a list with names of parameters used in the database.
-        database_parameters_names = []
-        for parameter in context.stored_routine.parameters:
-            database_parameters_names.append(parameter['name'])
+        database_parameters_names = [parameter['name'] for parameter in context.stored_routine.parameters]
 
         # Make a list with names of parameters used in dock block of routine.
-        doc_block_parameters_names = []
-        for parameter in context.doc_block.parameters():
-            doc_block_parameters_names.append(parameter['name'])
+        doc_block_parameters_names = [parameter['name'] for parameter in context.doc_block.parameters()]
 
         # Check and show warning if any parameter is missing in doc block.
-        for parameter in database_parameters_names:
-            if parameter not in doc_block_parameters_names:
-                self._io.warning('Parameter {} is missing in doc block'.format(parameter))
+        lookup = set(doc_block_parameters_names)
+        missing = [parameter for parameter in database_parameters_names if parameter not in lookup]
+        if missing:
+            self._io.warning('Parameters missing in doc block: {}'.format(', '.join(missing)))
 
         # Check and show warning if found unknown parameters in doc block.
-        for parameter in doc_block_parameters_names:
-            if parameter not in database_parameters_names:
-                self._io.warning('Unknown parameter {} found in doc block'.format(parameter))
+        lookup = set(database_parameters_names)
+        unknown = [parameter for parameter in doc_block_parameters_names if parameter not in lookup]
+        if unknown:
+            self._io.warning('Unknown parameters found in doc block: {}'.format(', '.join(unknown)))
 
     # ------------------------------------------------------------------------------------------------------------------
     def _substitute_placeholders(self, context: LoaderContext) -> None:
@@ -264,7 +261,7 @@ class CommonRoutineLoader(metaclass=abc.ABCMeta):
 
         :param context: The loader context.
         """
-        real_path = os.path.realpath(context.stored_routine.path)
+        real_path = context.stored_routine.real_path
         routine_name = os.path.splitext(os.path.basename(context.stored_routine.path))[0]
 
         context.placeholders.add_placeholder('__FILE__', f"'{real_path}'")
@@ -281,14 +278,12 @@ class CommonRoutineLoader(metaclass=abc.ABCMeta):
         """
         if os.linesep in sql:
             lines = sql.split(os.linesep)
-            digits = math.ceil(math.log(len(lines) + 1, 10))
-            i = 1
-            for line in lines:
+            digits = len(str(len(lines)))
+            for i, line in enumerate(lines, start=1):
                 if i == error_line:
-                    self._io.text('<error>{0:{width}} {1}</error>'.format(i, line, width=digits, ))
+                    self._io.text(f'<error>{i:{digits}d} {line}</error>')
                 else:
-                    self._io.text('{0:{width}} {1}'.format(i, line, width=digits, ))
-                i += 1
+                    self._io.text(f'{i:{digits}d} {line}')
         else:
             self._io.text(sql)
 
@@ -11,6 +11,47 @@ class DocBlockHelper:
     Helper class for extracting information for the Docblock of a stored routine.
     """
 
+    __doc_block_start: re.Pattern = re.compile(r'\s*/\*\*')
+    """
+    The pattern for the first line of a DocBlock.
+    """
+
+    __doc_block_end: re.Pattern = re.compile(r'\s*\*/')
+    """
+    The pattern for the last line of a DocBlock.
+    """
+
+    __type_tag: re.Pattern = re.compile(r'^(@type)\s+(?P<type>\w+)\s*(?P<extra>.*)', re.DOTALL)
+    """
+    The pattern for the @type tag.
+    """
+
+    __insert_many_extra: re.Pattern = re.compile(r'^(?P<table_name>\w+)\s*(?P<keys>.+)', re.DOTALL)
+    """
+    The pattern for the table name and keys of designation type insert_many.
+    """
+
+    __column_separator: re.Pattern = re.compile('[,\t\n ]+')
+    """
+    The pattern for separators in a list of columns or keys.
+    """
+
+    __return_type_separator: re.Pattern = re.compile('[,|\t\n ]+')
+    """
+    The pattern for separators in a list of return types.
+    """
+
+    __param_tag: re.Pattern = re.compile(r'^@param\s+(?P<name>\w+)\s*(?P<description>.+)?', re.DOTALL)
+    """
+    The pattern for the @param tag.
+    """
+
+    __param_tag_with_type: re.Pattern = re.compile(r'^@param\s+(?P<type>\w+)\s+:?(?P<name>\w+)\s*(?P<description>.+)?',
+                                                   re.DOTALL)
+    """
+    The pattern for the @param tag with a data type.
+    """
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self, routine_source: StoredRoutineHelper):
         """
@@ -18,7 +59,15 @@ class DocBlockHelper:
 
         :param routine_source: The routine source helper.
         """
-        self.__doc_block_reflection = DocBlockHelper.__create_doc_block_reflection(routine_source)
+        self.__routine_source: StoredRoutineHelper = routine_source
+        """
+        The routine source helper.
+        """
+
+        self.__doc_block_reflection: DocBlockReflection | None = None
+        """
+        The DocBlock reflection object, created only when the DocBlock is actually needed.
+        """
 
         self.__param_tags_have_types: bool = False
         """
@@ -30,6 +79,16 @@ class DocBlockHelper:
         The designation of the stored routine.
         """
 
+        self.__parameters: List[Dict[str, str]] | None = None
+        """
+        The parameters as found in the DocBlock of the stored routine.
+        """
+
+        self.__parameter_descriptions: Dict[str, str] | None = None
+        """
+        The map from parameter names to their descriptions as found in the DocBlock of the stored routine.
+        """
+
     # ------------------------------------------------------------------------------------------------------------------
     @property
     def param_tags_have_types(self):
@@ -46,7 +105,10 @@ class DocBlockHelper:
 
         :param param_tags_have_types: Whether @param tags have types.
         """
-        self.__param_tags_have_types = param_tags_have_types
+        if self.__param_tags_have_types != param_tags_have_types:
+            self.__param_tags_have_types = param_tags_have_types
+            self.__parameters = None
+            self.__parameter_descriptions = None
 
     # ------------------------------------------------------------------------------------------------------------------
     @property
@@ -55,14 +117,14 @@ class DocBlockHelper:
         Returns the designation of the stored routine.
         """
         if self.__designation is None:
-            tags = self.__doc_block_reflection.get_tags('type')
+            tags = self.__reflection.get_tags('type')
             if len(tags) == 0:
                 raise LoaderException('Tag @type not found.')
             if len(tags) > 1:
                 raise LoaderException('Found multiple @type tags.')
 
             tag = tags[0]
-            parts1 = re.match(r'^(@type)\s+(?P<type>\w+)\s*(?P<extra>.*)', tag, re.DOTALL)
+            parts1 = DocBlockHelper.__type_tag.match(tag)
             if not parts1:
                 raise LoaderException(f'Found @type tag without designation type. Found: {tag}')
 
@@ -70,22 +132,22 @@ class DocBlockHelper:
 
             if self.__designation['type'] in ['rows_with_key', 'rows_with_index']:
                 if parts1.group('extra').strip() != '':
-                    self.__designation['columns'] = re.split('[,\t\n ]+', parts1.group('extra'))
+                    self.__designation['columns'] = DocBlockHelper.__column_separator.split(parts1.group('extra'))
                 else:
                     raise LoaderException(f'Designation type {self.__designation['type']} requires a list of columns. '
                                           f'Found: {tag}')
 
             elif self.__designation['type'] == 'insert_many':
-                parts2 = re.match(r'^(?P<table_name>\w+)\s*(?P<keys>.+)', parts1.group('extra'), re.DOTALL)
+                parts2 = DocBlockHelper.__insert_many_extra.match(parts1.group('extra'))
                 if not parts2:
                     raise LoaderException(f'Designation type insert_many requires a table name and a list of keys. '
                                           f'Found: {tag}')
                 self.__designation['table_name'] = parts2.group('table_name')
-                self.__designation['keys'] = re.split('[,\t\n ]+', parts2.group('keys'))
+                self.__designation['keys'] = DocBlockHelper.__column_separator.split(parts2.group('keys'))
 
             elif self.__designation['type'] in ['singleton0', 'singleton1', 'function']:
                 if parts1.group('extra').strip() != '':
-                    self.__designation['return'] = re.split('[,|\t\n ]+', parts1.group('extra'))
+                    self.__designation['return'] = DocBlockHelper.__return_type_separator.split(parts1.group('extra'))
                 else:
                     raise LoaderException(f'Designation type {self.__designation['type']} requires a list of return ',
                                           f'types. Found: {tag}')
@@ -101,28 +163,31 @@ class DocBlockHelper:
         """
         Returns the description of the stored routine.
         """
-        return self.__doc_block_reflection.get_description()
+        return self.__reflection.get_description()
 
     # ------------------------------------------------------------------------------------------------------------------
     def parameters(self) -> List[Dict[str, str]]:
         """
         Returns the parameters as found in the DocBlock of the stored routine.
         """
-        parameters = []
-        for tag in self.__doc_block_reflection.get_tags('param'):
-            if self.__param_tags_have_types:
-                parts = re.match(r'^(@param)\s+(?P<type>\w+)\s+:?(?P<name>\w+)\s*(?P<description>.+)?', tag, re.DOTALL)
-                if parts:
-                    parameters.append({'name':        parts.group('name'),
-                                       'type':        parts.group('type'),
-                                       'description': parts.group('description')})
-            else:
-                parts = re.match(r'^(@param)\s+(?P<name>\w+)\s*(?P<description>.+)?', tag, re.DOTALL)
-                if parts:
-                    parameters.append({'name':        parts.group('name'),
-                                       'description': parts.group('description')})
-
-        return parameters
+        if self.__parameters is None:
+            parameters = []
+            for tag in self.__reflection.get_tags('param'):
+                if self.__param_tags_have_types:
+                    parts = DocBlockHelper.__param_tag_with_type.match(tag)
+                    if parts:
+                        parameters.append({'name':        parts.group('name'),
+                                           'type':        parts.group('type'),
+                                           'description': parts.group('description')})
+                else:
+                    parts = DocBlockHelper.__param_tag.match(tag)
+                    if parts:
+                        parameters.append({'name':        parts.group('name'),
+                                           'description': parts.group('description')})
+
+            self.__parameters = parameters
+
+        return self.__parameters
 
     # ------------------------------------------------------------------------------------------------------------------
     def parameter_description(self, name: str) -> str:
@@ -131,11 +196,23 @@ class DocBlockHelper:
 
         :param name: The name of the parameter.
         """
-        for parameter in self.parameters():
-            if parameter['name'] == name:
-                return parameter['description']
+        if self.__parameter_descriptions is None:
+            self.__parameter_descriptions = {}
+            for parameter in self.parameters():
+                self.__parameter_descriptions.setdefault(parameter['name'], parameter['description'])
 
-        return ''
+        return self.__parameter_descriptions.get(name, '')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def __reflection(self) -> DocBlockReflection:
+        """
+        Returns the DocBlock reflection object.
+        """
+        if self.__doc_block_reflection is None:
+            self.__doc_block_reflection = DocBlockHelper.__create_doc_block_reflection(self.__routine_source)
+
+        return self.__doc_block_reflection
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -161,17 +238,14 @@ class DocBlockHelper:
         line1 = None
         line2 = None
 
-        i = 0
-        for line in routine_source.code_lines:
-            if re.match(r'\s*/\*\*', line):
+        for i, line in enumerate(routine_source.code_lines):
+            if '/**' in line and DocBlockHelper.__doc_block_start.match(line):
                 line1 = i
 
-            if re.match(r'\s*\*/', line):
+            if '*/' in line and DocBlockHelper.__doc_block_end.match(line):
                 line2 = i
                 break
 
-            i += 1
-
         if line1 is None or line2 is None:
             raise LoaderException("No DocBlock found in {}.".format(routine_source.path))
 
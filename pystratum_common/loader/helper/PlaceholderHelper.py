@@ -9,6 +9,11 @@ class PlaceholderHelper:
     Class for replacing placeholder with their actual values in stored routines.
     """
 
+    __placeholder: re.Pattern = re.compile(r'@[A-Za-z0-9_.]+(%(max-)?type)?@')
+    """
+    The pattern for placeholders in the source of a stored routine.
+    """
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self):
         """
@@ -36,16 +41,45 @@ class PlaceholderHelper:
 
         :param code_lines: The source of the stored routine as an array of lines.
         """
-        new_code_lines = []
+        replace_pairs = dict(self.__placeholders)
+        replace_pairs['__LINE__'] = ''
 
-        for index, line in enumerate(code_lines):
-            self.__placeholders['__LINE__'] = "'%d'" % (index + 1)
-            for search, replace in self.__placeholders.items():
-                line = line.replace(search, replace)
-            new_code_lines.append(line)
+        # Longest placeholders first, such that a placeholder is never matched by a prefix of another placeholder.
+        searches = sorted(replace_pairs, key=len, reverse=True)
+        pattern = re.compile('|'.join(re.escape(search) for search in searches))
+
+        # Lines without '@' and '__' cannot contain a placeholder when all placeholders start with one of these.
+        fast_path = all(search.startswith(('@', '__')) for search in replace_pairs)
+
+        # Lines without __LINE__ are substituted only once, however often they occur.
+        substituted_lines = {}
+
+        new_code_lines = []
+        for line_number, line in enumerate(code_lines, start=1):
+            if fast_path and '@' not in line and '__' not in line:
+                new_code_lines.append(line)
+            elif '__LINE__' in line:
+                replace_pairs['__LINE__'] = f"'{line_number}'"
+                new_code_lines.append(PlaceholderHelper.__substitute_line(line, pattern, replace_pairs))
+            else:
+                if line not in substituted_lines:
+                    substituted_lines[line] = PlaceholderHelper.__substitute_line(line, pattern, replace_pairs)
+                new_code_lines.append(substituted_lines[line])
 
         return '\n'.join(new_code_lines)
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __substitute_line(line: str, pattern: re.Pattern, replace_pairs: Dict[str, str]) -> str:
+        """
+        Substitutes all replace pairs in a single line of the source of the stored routine.
+
+        :param line: The line.
+        :param pattern: The pattern matching any of the placeholders.
+        :param replace_pairs: The map from placeholders to their actual values.
+        """
+        return pattern.sub(lambda match: replace_pairs[match.group(0)], line)
+
     # ------------------------------------------------------------------------------------------------------------------
     def extract_placeholders(self, path: str, code: str) -> Dict[str, str]:
         """
@@ -55,8 +89,10 @@ class PlaceholderHelper:
         :param code: The source of the stored routine.
         """
         placeholders = {}
-        for match in re.finditer(r'(@[A-Za-z0-9_.]+(%(max-)?type)?@)', code):
+        for match in PlaceholderHelper.__placeholder.finditer(code):
             place_holder = match[0]
+            if place_holder in placeholders:
+                continue
             if place_holder not in self.__placeholders:
                 raise LoaderException("Unknown placeholder '{0}' in file {1}.".format(place_holder, path))
             placeholders[place_holder] = self.__placeholders[place_holder]
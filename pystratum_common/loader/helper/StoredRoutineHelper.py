@@ -36,6 +36,11 @@ class StoredRoutineHelper:
         The encoding of the source of the stored routine.
         """
 
+        self.__real_path: str | None = None
+        """
+        The canonical path to the source of the stored routine.
+        """
+
         self.__code: str | None = None
         """
         The code of the stored routine.
@@ -46,7 +51,7 @@ class StoredRoutineHelper:
         The code of the stored routine as an array of strings.
         """
 
-        self.__m_time: int = 0
+        self.__m_time: int | None = None
         """
         The last modification time of the source file.
         """
@@ -69,6 +74,17 @@ class StoredRoutineHelper:
         """
         return self.__path
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def real_path(self) -> str:
+        """
+        The canonical path to the source of the stored routine, i.e., with all symbolic links resolved.
+        """
+        if self.__real_path is None:
+            self.__real_path = os.path.realpath(self.__path)
+
+        return self.__real_path
+
     # ------------------------------------------------------------------------------------------------------------------
     @property
     def encoding(self) -> str:
@@ -95,7 +111,7 @@ class StoredRoutineHelper:
         The code of the stored routine as an array of strings.
         """
         if self.__code_lines is None:
-            self.__read_source_file()
+            self.__code_lines = self.code.split('\n')
 
         return self.__code_lines
 
@@ -106,7 +122,10 @@ class StoredRoutineHelper:
         The last modification time of the source file.
         """
         if self.__m_time is None:
-            self.__read_source_file()
+            try:
+                self.__m_time = int(os.stat(self.__path).st_mtime)
+            except Exception as exception:
+                raise LoaderException("Unable to stat '{}' caused by {}.".format(self.__path, exception))
 
         return self.__m_time
 
@@ -172,7 +191,9 @@ class StoredRoutineHelper:
         """
         if self.__code != code:
             Util.write_two_phases(self.__path, code, io)
-            self.__read_source_file()
+            self.__code = code
+            self.__code_lines = None
+            self.__m_time = None
 
     # ------------------------------------------------------------------------------------------------------------------
     def __read_source_file(self) -> None:
@@ -181,13 +202,12 @@ class StoredRoutineHelper:
         """
         try:
             with open(self.__path, 'r', encoding=self.__encoding) as file:
+                self.__m_time = int(os.fstat(file.fileno()).st_mtime)
                 self.__code = file.read()
 
-            self.__m_time = int(os.path.getmtime(self.__path))
-
         except Exception as exception:
             raise LoaderException("Unable to read '{}' caused by {}.".format(self.__path, exception))
 
-        self.__code_lines = self.__code.split('\n')
+        self.__code_lines = None
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -11,6 +11,11 @@ class TypeHintHelper:
     Class for replacing type hints with their actual data types in stored routines.
     """
 
+    __aligned_hint: re.Pattern = re.compile(r'--(?P<hint>\s+type:\s+.*)$')
+    """
+    The pattern for a type hint to be aligned.
+    """
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self):
         """
@@ -43,12 +48,14 @@ class TypeHintHelper:
         parts = {'whitespace': r'(?P<whitespace>\s+)',
                  'type_list':  r'(?P<datatype>(type-list)(?P<extra>.*)?)'.replace('type-list', all_columns_types),
                  'hint':       r'(?P<hint>\s+--\s+type:\s+(\w+\.)?\w+\.\w+(%max)?\s*)$'}
-        pattern = ''.join(parts.values())
+        hint_pattern = re.compile(parts['hint'])
+        pattern = re.compile(''.join(parts.values()), re.IGNORECASE)
 
         code_lines = copy.copy(code_lines)
         for index, line in enumerate(code_lines):
-            if re.search(parts['hint'], line):
-                matches = re.search(pattern, line, re.IGNORECASE)
+            # Cheap test first, the vast majority of lines has no type hint at all.
+            if '--' in line and hint_pattern.search(line):
+                matches = pattern.search(line)
                 if not matches:
                     raise LoaderException(f'Found a type hint at line {index + 1}, but unable to find data type.')
 
@@ -90,26 +97,21 @@ class TypeHintHelper:
         :param code_lines: The source of the stored routine as an array of lines.
         """
         blocks = []
-        start = None
+        block = []
         length = 0
         for index, line in enumerate(code_lines):
-            match = re.search(r'--\s+type:\s+.*$', line)
+            match = TypeHintHelper.__aligned_hint.search(line) if '--' in line else None
             if match:
-                if start is None:
-                    start = index
-                length = max(length, len(line) - len(match.group(0)) + 2)
-            else:
-                if start is not None:
-                    blocks.append({'first': start, 'last': index, 'length': length})
-                    start = None
-                    length = 0
-
-        for block in blocks:
-            for index in range(block['first'], block['last']):
-                matches = re.search(r'\s+type:\s+.*$', code_lines[index])
-                left_part = code_lines[index][0:-len(matches.group(0))].rstrip()
-                left_part = left_part + ' ' * (block['length'] - len(left_part) + 1)
-                code_lines[index] = left_part + matches.group(0).lstrip()
+                block.append((index, line[0:match.start('hint')].rstrip(), match.group('hint').lstrip()))
+                length = max(length, match.start() + 2)
+            elif block:
+                blocks.append((block, length))
+                block = []
+                length = 0
+
+        for block, length in blocks:
+            for index, left_part, hint in block:
+                code_lines[index] = left_part + ' ' * (length - len(left_part) + 1) + hint
 
         return code_lines
 
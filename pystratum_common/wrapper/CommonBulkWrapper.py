@@ -2,6 +2,7 @@ import re
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -10,6 +11,8 @@ class CommonBulkWrapper(CommonWrapper, ABC):
     Wrapper method generator for stored procedures with designation type bulk.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -17,7 +20,7 @@ class CommonBulkWrapper(CommonWrapper, ABC):
 
         :param context: The wrapper context.
         """
-        return 'int'
+        return ReturnTypeHint.INT
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
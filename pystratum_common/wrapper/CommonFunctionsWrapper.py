@@ -9,6 +9,8 @@ class CommonFunctionsWrapper(CommonWrapper, ABC):
     Wrapper method generator for stored functions.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
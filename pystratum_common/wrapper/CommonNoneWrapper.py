@@ -1,6 +1,7 @@
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -9,6 +10,8 @@ class CommonNoneWrapper(CommonWrapper, ABC):
     Wrapper method generator for stored procedures without any result set.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -16,6 +19,6 @@ class CommonNoneWrapper(CommonWrapper, ABC):
 
         :param context: The wrapper context.
         """
-        return 'int'
+        return ReturnTypeHint.INT
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -9,6 +10,8 @@ class CommonRow0Wrapper(CommonWrapper, ABC):
     Wrapper method generator for stored procedures that are selecting 0 or 1 row.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -18,6 +21,6 @@ class CommonRow0Wrapper(CommonWrapper, ABC):
         """
         context.code_store.add_import('typing', 'Any')
 
-        return 'Any'
+        return ReturnTypeHint.ANY
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -9,6 +10,8 @@ class CommonRow1Wrapper(CommonWrapper, ABC):
     Wrapper method generator for stored procedures that are selecting 1 row.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -19,6 +22,6 @@ class CommonRow1Wrapper(CommonWrapper, ABC):
         context.code_store.add_import('typing', 'Any')
         context.code_store.add_import('typing', 'Dict')
 
-        return 'Dict[str, Any]'
+        return ReturnTypeHint.ROW
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -2,6 +2,7 @@ import abc
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -11,6 +12,8 @@ class CommonRowsWithIndexWrapper(CommonWrapper, ABC):
     structure using a combination of non-unique columns.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -20,7 +23,7 @@ class CommonRowsWithIndexWrapper(CommonWrapper, ABC):
         """
         context.code_store.add_import('typing', 'Dict')
 
-        return 'Dict'
+        return ReturnTypeHint.DICT
 
     # ------------------------------------------------------------------------------------------------------------------
     @abc.abstractmethod
@@ -39,61 +42,18 @@ class CommonRowsWithIndexWrapper(CommonWrapper, ABC):
 
         :param context: The wrapper context.
         """
-        context.code_store.append_line('ret = {}')
+        code_store = context.code_store
+        code_store.append_line('ret = {}')
         self._build_execute_rows(context)
-        context.code_store.append_line('for row in rows:')
+        code_store.append_line('for row in rows:')
 
         columns = context.pystratum_metadata['designation']['columns']
-        num_of_dict = len(columns)
-
-        i = 0
-        while i < num_of_dict:
-            value = "row['{0!s}']".format(columns[i])
-
-            stack = ''
-            j = 0
-            while j < i:
-                stack += "[row['{0!s}']]".format(columns[j])
-                j += 1
-            line = 'if {0!s} in ret{1!s}:'.format(value, stack)
-            context.code_store.append_line(line)
-            i += 1
-
-        line = 'ret'
-        for column_name in columns:
-            line += "[row['{0!s}']]".format(column_name)
-        line += '.append(row)'
-        context.code_store.append_line(line)
-        context.code_store.decrement_indent_level()
-
-        i = num_of_dict
-        while i > 0:
-            context.code_store.append_line('else:')
-
-            part1 = ''
-            j = 0
-            while j < i - 1:
-                part1 += "[row['{0!s}']]".format(columns[j])
-                j += 1
-            part1 += "[row['{0!s}']]".format(columns[j])
-
-            part2 = ''
-            j = i - 1
-            while j < num_of_dict:
-                if j + 1 != i:
-                    part2 += "{{row['{0!s}']: ".format(columns[j])
-                j += 1
-            part2 += "[row]" + ('}' * (num_of_dict - i))
-
-            line = "ret{0!s} = {1!s}".format(part1, part2)
-            context.code_store.append_line(line)
-            context.code_store.decrement_indent_level()
-            if i > 1:
-                context.code_store.decrement_indent_level()
-            i -= 1
+        parts = [f".setdefault(row['{column}'], {{}})" for column in columns[:-1]]
+        parts.append(f".setdefault(row['{columns[-1]}'], [])")
+        code_store.append_line(f"ret{''.join(parts)}.append(row)")
 
-        context.code_store.append_line()
-        context.code_store.decrement_indent_level()
-        context.code_store.append_line('return ret')
+        code_store.append_line()
+        code_store.decrement_indent_level()
+        code_store.append_line('return ret')
 
 # ----------------------------------------------------------------------------------------------------------------------
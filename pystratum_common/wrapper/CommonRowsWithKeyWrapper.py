@@ -1,7 +1,10 @@
 import abc
+import functools
 from abc import ABC
+from typing import Tuple
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -11,6 +14,8 @@ class CommonRowsWithKeyWrapper(CommonWrapper, ABC):
     structure using a combination of unique columns.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -20,7 +25,7 @@ class CommonRowsWithKeyWrapper(CommonWrapper, ABC):
         """
         context.code_store.add_import('typing', 'Dict')
 
-        return 'Dict'
+        return ReturnTypeHint.DICT
 
     # ------------------------------------------------------------------------------------------------------------------
     @abc.abstractmethod
@@ -39,60 +44,51 @@ class CommonRowsWithKeyWrapper(CommonWrapper, ABC):
 
         :param context: The wrapper context.
         """
-        context.code_store.append_line('ret = {}')
+        code_store = context.code_store
+        columns = context.pystratum_metadata['designation']['columns']
+
+        code_store.append_line('ret = {}')
         self._build_execute_rows(context)
-        context.code_store.append_line('for row in rows:')
+        if len(columns) == 1:
+            bind_key = f"key0 = row['{columns[0]}']"
+        else:
+            code_store.add_import('operator', 'itemgetter')
+            arguments = ', '.join(f"'{column}'" for column in columns)
+            code_store.append_line(f'get_key = itemgetter({arguments})')
+            bind_key = f"{', '.join(f'key{i}' for i in range(len(columns)))} = get_key(row)"
+        code_store.append_line('for row in rows:')
+        code_store.append_line(bind_key)
+        code_store.append_lines(CommonRowsWithKeyWrapper.__build_nested_dicts(len(columns)))
+
+        code_store.append_line()
+        code_store.decrement_indent_level()
+        code_store.append_line('return ret')
 
-        columns = context.pystratum_metadata['designation']['columns']
-        num_of_dict = len(columns)
-
-        i = 0
-        while i < num_of_dict:
-            value = "row['{0!s}']".format(columns[i])
-
-            stack = ''
-            j = 0
-            while j < i:
-                stack += "[row['{0!s}']]".format(columns[j])
-                j += 1
-            line = 'if {0!s} in ret{1!s}:'.format(value, stack)
-            context.code_store.append_line(line)
-            i += 1
-
-        line = "raise Exception('Duplicate key for %s.' % str(({0!s})))". \
-            format(", ".join(["row['{0!s}']".format(column_name) for column_name in columns]))
-
-        context.code_store.append_line(line)
-        context.code_store.decrement_indent_level()
-
-        i = num_of_dict
-        while i > 0:
-            context.code_store.append_line('else:')
-
-            part1 = ''
-            j = 0
-            while j < i - 1:
-                part1 += "[row['{0!s}']]".format(columns[j])
-                j += 1
-            part1 += "[row['{0!s}']]".format(columns[j])
-
-            part2 = ''
-            j = i - 1
-            while j < num_of_dict:
-                if j + 1 != i:
-                    part2 += "{{row['{0!s}']: ".format(columns[j])
-                j += 1
-            part2 += "row" + ('}' * (num_of_dict - i))
-
-            line = "ret{0!s} = {1!s}".format(part1, part2)
-            context.code_store.append_line(line)
-            context.code_store.decrement_indent_level()
-            if i > 1:
-                context.code_store.decrement_indent_level()
-            i -= 1
-
-        context.code_store.append_line()
-        context.code_store.decrement_indent_level()
-        context.code_store.append_line('return ret')
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @functools.cache
+    def __build_nested_dicts(num_of_keys: int) -> Tuple[Tuple[int, str], ...]:
+        """
+        Returns the code that checks the key of a row is unique and stores the row in the nested dictionaries, given
+        the parts of the key are bound to key0, key1, etc. Each line of code is paired with its indent level relative
+        to the body of the for loop over the rows.
+
+        :param num_of_keys: The number of columns of the key.
+        """
+        keys = [f'key{i}' for i in range(num_of_keys)]
+
+        if num_of_keys == 1:
+            code = []
+            node = 'ret'
+        else:
+            parts = [f'.setdefault({key}, {{}})' for key in keys[:-1]]
+            code = [(0, f"node = ret{''.join(parts)}")]
+            node = 'node'
+
+        code.append((0, f'if {keys[-1]} in {node}:'))
+        code.append((1, f"raise Exception('Duplicate key for %s.' % str(({', '.join(keys)})))"))
+        code.append((0, f'{node}[{keys[-1]}] = row'))
+
+        return tuple(code)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -9,6 +10,8 @@ class CommonRowsWrapper(CommonWrapper, ABC):
     Wrapper method generator for stored procedures that are selecting 0, 1, or more rows.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -20,6 +23,6 @@ class CommonRowsWrapper(CommonWrapper, ABC):
         context.code_store.add_import('typing', 'Dict')
         context.code_store.add_import('typing', 'List')
 
-        return 'List[Dict[str, Any]]'
+        return ReturnTypeHint.ROWS
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -9,6 +9,8 @@ class CommonSingleton1Wrapper(CommonWrapper, ABC):
     Wrapper method generator for stored procedures that are selecting 1 row with one column only.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -1,6 +1,7 @@
 from abc import ABC
 
 from pystratum_common.wrapper.CommonWrapper import CommonWrapper
+from pystratum_common.wrapper.helper.ReturnTypeHint import ReturnTypeHint
 from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
 
 
@@ -9,6 +10,8 @@ class CommonTableWrapper(CommonWrapper, ABC):
     Wrapper method generator for printing the result set of stored procedures in a table format.
     """
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self, context: WrapperContext) -> str:
         """
@@ -16,6 +19,6 @@ class CommonTableWrapper(CommonWrapper, ABC):
 
         :param context: The wrapper context.
         """
-        return 'int'
+        return ReturnTypeHint.INT
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -10,6 +10,11 @@ class CommonWrapper(ABC):
     Parent class for classes that generate Python code, i.e. wrappers, for invoking stored routines.
     """
 
+    __slots__ = ()
+    """
+    Wrapper method generators are stateless, hence instances do not need a __dict__.
+    """
+
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
     def _build_docstring_description(context: WrapperContext) -> None:
@@ -29,22 +34,20 @@ class CommonWrapper(ABC):
         :param context: The wrapper context.
         """
         if context.pystratum_metadata['pydoc']['parameters']:
-            context.code_store.append_line('')
+            code_store = context.code_store
+            code_store.append_line('')
 
             for param in context.pystratum_metadata['pydoc']['parameters']:
+                name = param['name']
                 lines = param['description'].split(os.linesep)
-                context.code_store.append_line(
-                        ':param {0}: {1}'.format(param['name'], lines[0]))
-                del lines[0]
+                code_store.append_line(f':param {name}: {lines[0]}')
 
-                tmp = ':param {0}:'.format(param['name'])
-                indent = ' ' * len(tmp)
-                for line in lines:
-                    context.code_store.append_line('{0} {1}'.format(indent, line))
+                indent = ' ' * len(f':param {name}:')
+                for line in lines[1:]:
+                    code_store.append_line(f'{indent} {line}')
 
                 if param['data_type_descriptor']:
-                    context.code_store.append_line(
-                        '{0} RDBMS data type: {1}'.format(indent, param['data_type_descriptor']))
+                    code_store.append_line(f"{indent} RDBMS data type: {param['data_type_descriptor']}")
 
     # ------------------------------------------------------------------------------------------------------------------
     def _build_docstring(self, context: WrapperContext) -> None:
@@ -88,18 +91,14 @@ class CommonWrapper(ABC):
 
         :param context: The wrapper context.
         """
-        ret = 'self'
-
+        args = ['self']
         for parameter_info in context.pystratum_metadata['pydoc']['parameters']:
-            if ret:
-                ret += ', '
-
-            ret += parameter_info['name']
-
             if parameter_info['python_type']:
-                ret += ': ' + parameter_info['python_type'] + ' | None'
+                args.append(f"{parameter_info['name']}: {parameter_info['python_type']} | None")
+            else:
+                args.append(parameter_info['name'])
 
-        return ret
+        return ', '.join(args)
 
     # ------------------------------------------------------------------------------------------------------------------
     def build(self, context: WrapperContext) -> None:
@@ -110,10 +109,10 @@ class CommonWrapper(ABC):
         """
         context.code_store.append_line()
         context.code_store.append_separator()
-        context.code_store.append_line(
-                'def {0!s}({1!s}) -> {2!s}:'.format(str(context.pystratum_metadata['routine_name']),
-                                                    str(self._wrapper_args(context)),
-                                                    str(self._return_type_hint(context))))
+        routine_name = context.pystratum_metadata['routine_name']
+        wrapper_args = self._wrapper_args(context)
+        return_type_hint = self._return_type_hint(context)
+        context.code_store.append_line(f'def {routine_name}({wrapper_args}) -> {return_type_hint}:')
         self._build_docstring(context)
         self._build_result_handler(context)
         context.code_store.decrement_indent_level()
@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import Dict, Iterable, List, Set, Tuple
 
 
 class PythonCodeStore:
@@ -21,9 +21,9 @@ class PythonCodeStore:
         The lines of Python code.
         """
 
-        self.__imports: Set[str] = set()
+        self.__imports: Set[Tuple[str, str]] = set()
         """
-        The list of imports.
+        The set of imports as pairs of package name and module name.
         """
 
         self.__indent_level: int = 0
@@ -31,6 +31,11 @@ class PythonCodeStore:
         The current level of indentation in the generated code.
         """
 
+        self.__indents: Dict[int, str] = {}
+        """
+        The map from indent levels to their leading whitespace.
+        """
+
     # ------------------------------------------------------------------------------------------------------------------
     def get_code(self) -> str:
         """
@@ -39,7 +44,8 @@ class PythonCodeStore:
         code = ''
 
         if self.__imports:
-            code = '\n'.join(sorted(self.__imports))
+            code = '\n'.join(sorted(f'from {package_name} import {module_name}'
+                                     for package_name, module_name in self.__imports))
             code += '\n\n\n'
 
         code += '\n'.join(self.__lines)
@@ -54,22 +60,33 @@ class PythonCodeStore:
         :param line: The line of code.
         """
         if line:
-            line = (' ' * 4 * self.__indent_level) + str(line)
+            line = self.__indent(self.__indent_level) + str(line)
         else:
             line = ''
 
-        self.__lines.append(str(line))
+        self.__lines.append(line)
 
-        if line[-1:] == ':':
+        if line.endswith(':'):
             self.__indent_level += 1
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def append_lines(self, lines: Iterable[Tuple[int, str]]) -> None:
+        """
+        Appends lines to the code. Each line is indented relative to the current indent level. Unlike append_line, this
+        method does not change the current indent level.
+
+        :param lines: The lines of code as pairs of the relative indent level and the line of code.
+        """
+        indent_level = self.__indent_level
+        self.__lines.extend(self.__indent(indent_level + level) + line if line else '' for level, line in lines)
+
     # ------------------------------------------------------------------------------------------------------------------
     def append_separator(self) -> None:
         """
         Inserts a horizontal (commented) line tot the generated code.
         """
         tmp = self.__page_width - ((4 * self.__indent_level) + 2)
-        self.__lines.append((' ' * 4 * self.__indent_level) + '# ' + ('-' * tmp))
+        self.__lines.append(self.__indent(self.__indent_level) + '# ' + ('-' * tmp))
 
     # ------------------------------------------------------------------------------------------------------------------
     def add_import(self, package_name: str, module_name: str) -> None:
@@ -79,7 +96,7 @@ class PythonCodeStore:
         :param module_name: The name of the package.
         :param package_name: The name of the module.
         """
-        self.__imports.add(f'from {package_name} import {module_name}')
+        self.__imports.add((package_name, module_name))
 
     # ------------------------------------------------------------------------------------------------------------------
     def decrement_indent_level(self, levels: int = 1) -> None:
@@ -90,4 +107,18 @@ class PythonCodeStore:
         """
         self.__indent_level -= int(levels)
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def __indent(self, level: int) -> str:
+        """
+        Returns the leading whitespace for an indent level.
+
+        :param level: The indent level.
+        """
+        indent = self.__indents.get(level)
+        if indent is None:
+            indent = ' ' * 4 * level
+            self.__indents[level] = indent
+
+        return indent
+
 # ----------------------------------------------------------------------------------------------------------------------
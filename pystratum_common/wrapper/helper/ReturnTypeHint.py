@@ -0,0 +1,36 @@
+class ReturnTypeHint:
+    """
+    The fixed return type hints of wrapper methods.
+    """
+    # ------------------------------------------------------------------------------------------------------------------
+    ANY: str = 'Any'
+    """
+    The return type hint for a single row or none.
+    """
+
+    DICT: str = 'Dict'
+    """
+    The return type hint for rows in a tree structure.
+    """
+
+    INT: str = 'int'
+    """
+    The return type hint for the number of rows.
+    """
+
+    MULTI: str = 'List[List[Dict[str, Any]]]'
+    """
+    The return type hint for multiple result sets.
+    """
+
+    ROW: str = 'Dict[str, Any]'
+    """
+    The return type hint for a single row.
+    """
+
+    ROWS: str = 'List[Dict[str, Any]]'
+    """
+    The return type hint for a list of rows.
+    """
+
+# ----------------------------------------------------------------------------------------------------------------------
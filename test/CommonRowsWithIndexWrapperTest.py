@@ -0,0 +1,44 @@
+from pystratum_common.wrapper.CommonRowsWithIndexWrapper import CommonRowsWithIndexWrapper
+from test.RowsWrapperTestCase import RowsWrapperTestCase
+
+
+class CommonRowsWithIndexWrapperTest(RowsWrapperTestCase):
+    """
+    Unit test for class CommonRowsWithIndexWrapper.
+    """
+
+    wrapper_class = CommonRowsWithIndexWrapper
+
+    designation_type = 'rows_with_index'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test with two columns.
+        """
+        code = self.build(['tst_c00', 'tst_c01'])
+
+        expected = '''from typing import Dict
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def tst_test_rows_with_index(self) -> Dict:
+    """
+    Test for designation type rows_with_index.
+    """
+    ret = {}
+    rows = self.execute_sp_rows(None)
+    for row in rows:
+        ret.setdefault(row['tst_c00'], {}).setdefault(row['tst_c01'], []).append(row)
+
+    return ret'''
+        self.assertEqual(expected, code)
+
+        rows = [{'tst_c00': 1, 'tst_c01': 'a'},
+                {'tst_c00': 1, 'tst_c01': 'b'},
+                {'tst_c00': 1, 'tst_c01': 'a'},
+                {'tst_c00': 2, 'tst_c01': 'a'}]
+        self.assertEqual({1: {'a': [rows[0], rows[2]], 'b': [rows[1]]}, 2: {'a': [rows[3]]}}, self.call(code, rows))
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,66 @@
+from pystratum_common.wrapper.CommonRowsWithKeyWrapper import CommonRowsWithKeyWrapper
+from test.RowsWrapperTestCase import RowsWrapperTestCase
+
+
+class CommonRowsWithKeyWrapperTest(RowsWrapperTestCase):
+    """
+    Unit test for class CommonRowsWithKeyWrapper.
+    """
+
+    wrapper_class = CommonRowsWithKeyWrapper
+
+    designation_type = 'rows_with_key'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test with one column.
+        """
+        code = self.build(['tst_c00'])
+        self.assertNotIn('itemgetter', code)
+
+        rows = [{'tst_c00': 1}, {'tst_c00': 2}]
+        self.assertEqual({1: rows[0], 2: rows[1]}, self.call(code, rows))
+
+        with self.assertRaises(Exception):
+            self.call(code, [{'tst_c00': 1}, {'tst_c00': 1}])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test with two columns.
+        """
+        code = self.build(['tst_c00', 'tst_c01'])
+
+        expected = '''from operator import itemgetter
+from typing import Dict
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def tst_test_rows_with_key(self) -> Dict:
+    """
+    Test for designation type rows_with_key.
+    """
+    ret = {}
+    rows = self.execute_sp_rows(None)
+    get_key = itemgetter('tst_c00', 'tst_c01')
+    for row in rows:
+        key0, key1 = get_key(row)
+        node = ret.setdefault(key0, {})
+        if key1 in node:
+            raise Exception('Duplicate key for %s.' % str((key0, key1)))
+        node[key1] = row
+
+    return ret'''
+        self.assertEqual(expected, code)
+
+        rows = [{'tst_c00': 1, 'tst_c01': 'a'},
+                {'tst_c00': 1, 'tst_c01': 'b'},
+                {'tst_c00': 2, 'tst_c01': 'a'}]
+        self.assertEqual({1: {'a': rows[0], 'b': rows[1]}, 2: {'a': rows[2]}}, self.call(code, rows))
+
+        with self.assertRaises(Exception):
+            self.call(code, [{'tst_c00': 1, 'tst_c01': 'a'}, {'tst_c00': 1, 'tst_c01': 'a'}])
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,59 @@
+import unittest
+
+from pystratum_common.exception.LoaderException import LoaderException
+from pystratum_common.loader.helper.PlaceholderHelper import PlaceholderHelper
+
+
+class PlaceholderHelperTest(unittest.TestCase):
+    """
+    Unit test for class PlaceholderHelper.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test substitution of placeholders.
+        """
+        helper = PlaceholderHelper()
+        helper.add_placeholder('@tst_foo.bar%type@', 'int(10) unsigned')
+        helper.add_placeholder('@LANGUAGE@', "'nl'")
+        helper.add_placeholder('__ROUTINE__', "'tst_test'")
+
+        code_lines = ['create procedure tst_test(in p_bar @tst_foo.bar%type@)',
+                      'begin',
+                      '  select @LANGUAGE@, @LANGUAGE@, __ROUTINE__, __LINE__;',
+                      'end']
+        code = helper.substitute_placeholders(code_lines)
+
+        self.assertEqual('create procedure tst_test(in p_bar int(10) unsigned)\n'
+                         'begin\n'
+                         "  select 'nl', 'nl', 'tst_test', '3';\n"
+                         'end', code)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test extraction of placeholders.
+        """
+        helper = PlaceholderHelper()
+        helper.add_placeholder('@tst_foo.bar%type@', 'int(10) unsigned')
+        helper.add_placeholder('@LANGUAGE@', "'nl'")
+        helper.add_placeholder('@UNUSED@', '1')
+
+        placeholders = helper.extract_placeholders('tst_test.psql', 'select @LANGUAGE@, @tst_foo.bar%type@, @LANGUAGE@')
+        self.assertEqual({'@LANGUAGE@': "'nl'", '@tst_foo.bar%type@': 'int(10) unsigned'}, placeholders)
+
+        self.assertTrue(helper.compare_placeholders(placeholders))
+        self.assertFalse(helper.compare_placeholders({'@LANGUAGE@': "'en'"}))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test03(self):
+        """
+        Test unknown placeholder.
+        """
+        helper = PlaceholderHelper()
+
+        with self.assertRaises(LoaderException):
+            helper.extract_placeholders('tst_test.psql', 'select @UNKNOWN@')
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,73 @@
+import unittest
+from typing import Any, Dict, List
+
+from pystratum_common.wrapper.helper.PythonCodeStore import PythonCodeStore
+from pystratum_common.wrapper.helper.WrapperContext import WrapperContext
+
+
+class RowsWrapperTestCase(unittest.TestCase):
+    """
+    Parent class for unit tests of wrapper method generators for stored procedures selecting rows.
+    """
+
+    wrapper_class: type | None = None
+    """
+    The wrapper method generator under test, without an implementation of _build_execute_rows.
+    """
+
+    designation_type: str | None = None
+    """
+    The designation type of the stored procedure.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def routine_name(self) -> str:
+        """
+        The name of the stored procedure.
+        """
+        return f'tst_test_{self.designation_type}'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self, columns: List[str]) -> str:
+        """
+        Returns the generated code of the wrapper method for the stored procedure.
+
+        :param columns: The columns of the designation.
+        """
+        metadata = {'routine_name': self.routine_name,
+                    'designation':  {'type': self.designation_type, 'columns': columns},
+                    'pydoc':        {'description': f'Test for designation type {self.designation_type}.',
+                                     'parameters':  []}}
+
+        wrapper_class = type('Wrapper', (self.wrapper_class,), {'_build_execute_rows': _build_execute_rows})
+        code_store = PythonCodeStore()
+        wrapper_class().build(WrapperContext(code_store, metadata))
+
+        return code_store.get_code()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def call(self, code: str, rows: List[Dict[str, Any]]) -> Any:
+        """
+        Executes the generated code and returns the result of the wrapper method.
+
+        :param code: The generated code.
+        :param rows: The rows selected by the stored procedure.
+        """
+        namespace = {}
+        exec(code, namespace)
+        data_layer = type('DataLayer', (), {'execute_sp_rows': lambda self, _: rows})
+
+        return namespace[self.routine_name](data_layer())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _build_execute_rows(self, context: WrapperContext) -> None:
+    """
+    Builds the code for invoking the stored procedure.
+
+    :param context: The wrapper context.
+    """
+    context.code_store.append_line('rows = self.execute_sp_rows(None)')
+
+# ----------------------------------------------------------------------------------------------------------------------
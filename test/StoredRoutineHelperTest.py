@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pystratum_common.exception.LoaderException import LoaderException
+from pystratum_common.loader.helper.DocBlockHelper import DocBlockHelper
+from pystratum_common.loader.helper.StoredRoutineHelper import StoredRoutineHelper
+
+
+class NullIO:
+    """
+    Output decorator that discards all output.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def text(self, text: str) -> None:
+        """
+        Discards a line of text.
+
+        :param text: The text.
+        """
+        pass
+
+
+class StoredRoutineHelperTest(unittest.TestCase):
+    """
+    Unit test for class StoredRoutineHelper.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        """
+        Creates a temporary directory for the sources of stored routines.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write_source(self, code: str) -> str:
+        """
+        Writes the source of a stored routine and returns its path.
+
+        :param code: The code of the stored routine.
+        """
+        path = os.path.join(self.directory.name, 'tst_test.psql')
+        with open(path, 'w') as file:
+            file.write(code)
+        os.utime(path, (1000000000, 1000000000))
+
+        return path
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test the modification time is available without reading the source.
+        """
+        path = self.write_source('create procedure tst_test()\nbegin\nend\n')
+        helper = StoredRoutineHelper('tst_test', path, 'utf-8')
+
+        with mock.patch('builtins.open', side_effect=AssertionError('Source must not be read.')):
+            self.assertEqual(int(os.stat(path).st_mtime), helper.m_time)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test the modification time of a missing source.
+        """
+        helper = StoredRoutineHelper('tst_test', os.path.join(self.directory.name, 'tst_missing.psql'), 'utf-8')
+
+        with self.assertRaises(LoaderException):
+            helper.m_time
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test03(self):
+        """
+        Test updating the source resets the code lines and the modification time.
+        """
+        path = self.write_source('create procedure tst_test()\nbegin\nend\n')
+        helper = StoredRoutineHelper('tst_test', path, 'utf-8')
+        self.assertEqual(['create procedure tst_test()', 'begin', 'end', ''], helper.code_lines)
+        self.assertEqual(1000000000, helper.m_time)
+
+        helper.update_source('create procedure tst_test()\nbegin\n  select 1;\nend\n', NullIO())
+
+        self.assertEqual(['create procedure tst_test()', 'begin', '  select 1;', 'end', ''], helper.code_lines)
+        self.assertEqual(int(os.stat(path).st_mtime), helper.m_time)
+        self.assertNotEqual(1000000000, helper.m_time)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test04(self):
+        """
+        Test a missing DocBlock is reported only when the DocBlock is needed.
+        """
+        path = self.write_source('create procedure tst_test()\nbegin\nend\n')
+        helper = DocBlockHelper(StoredRoutineHelper('tst_test', path, 'utf-8'))
+
+        with self.assertRaises(LoaderException):
+            helper.designation
+
+        with self.assertRaises(LoaderException):
+            helper.parameters()
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,49 @@
+import unittest
+
+from pystratum_common.loader.helper.TypeHintHelper import TypeHintHelper
+
+
+class TypeHintHelperTest(unittest.TestCase):
+    """
+    Unit test for class TypeHintHelper.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test aligning blocks of type hints.
+        """
+        code_lines = ['create procedure tst_test(in p_id   int,         -- type: tst_foo.foo_id',
+                      '                          in p_name varchar(80)  --   type: tst_foo.foo_name',
+                      '                          in p_ok   tinyint(1))',
+                      'begin',
+                      '  declare l_id int; -- type: tst_foo.foo_id',
+                      '',
+                      '  select 1;',
+                      'end']
+
+        helper = TypeHintHelper()
+        code_lines = helper.align_type_hints(code_lines)
+
+        self.assertEqual(['create procedure tst_test(in p_id   int,         -- type: tst_foo.foo_id',
+                          '                          in p_name varchar(80)  -- type: tst_foo.foo_name',
+                          '                          in p_ok   tinyint(1))',
+                          'begin',
+                          '  declare l_id int; -- type: tst_foo.foo_id',
+                          '',
+                          '  select 1;',
+                          'end'], code_lines)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test comparing type hints.
+        """
+        helper = TypeHintHelper()
+        helper.add_type_hint('tst_foo.foo_id', 'int(10) unsigned')
+
+        self.assertTrue(helper.compare_type_hints({'tst_foo.foo_id': 'int(10) unsigned'}))
+        self.assertFalse(helper.compare_type_hints({'tst_foo.foo_id': 'int(11)'}))
+        self.assertFalse(helper.compare_type_hints({'tst_foo.foo_name': 'varchar(80)'}))
+
+# ----------------------------------------------------------------------------------------------------------------------